@@ -0,0 +1,65 @@
+"""
+Memory benchmark: PlaceRecord vs the plain dicts the scrapers used to store.
+Replicates the sample places in google_places.json and measures with tracemalloc.
+
+Usage: python benchmark_place_record.py [count]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from place_record import PlaceRecord
+
+
+def fresh(value):
+    """Copy a string so each place owns its values, like a real scrape does"""
+    return (value + '.')[:-1] if isinstance(value, str) else value
+
+
+def build_dicts(samples, count):
+    """Build `count` place dicts the old way"""
+    return [
+        {key: fresh(value) for key, value in samples[i % len(samples)].items()}
+        for i in range(count)
+    ]
+
+
+def build_records(samples, count):
+    """Build `count` PlaceRecords from the same data"""
+    return [
+        PlaceRecord.from_dict({key: fresh(value) for key, value in samples[i % len(samples)].items()})
+        for i in range(count)
+    ]
+
+
+def measure(builder, samples, count):
+    """Return bytes still allocated after building `count` places"""
+    tracemalloc.start()
+    places = builder(samples, count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del places
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with open('google_places.json', encoding='utf-8') as f:
+        samples = json.load(f)
+
+    # Output must be unchanged by the round trip
+    assert [PlaceRecord.from_dict(place).to_dict() for place in samples] == samples
+
+    dict_bytes = measure(build_dicts, samples, count)
+    record_bytes = measure(build_records, samples, count)
+
+    print(f"Places:       {count}")
+    print(f"dict:         {dict_bytes / 1024 / 1024:.1f} MiB ({dict_bytes / count:.0f} B/place)")
+    print(f"PlaceRecord:  {record_bytes / 1024 / 1024:.1f} MiB ({record_bytes / count:.0f} B/place)")
+    print(f"Saved:        {100 * (1 - record_bytes / dict_bytes):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import csv
 import re
 
+from place_record import PlaceRecord
+
 def clean_text(text):
     """Remove weird symbols, extra whitespace, and newlines."""
     if not text:
@@ -11,9 +13,17 @@ def clean_text(text):
     text = re.sub(r'\s+', ' ', text)
     return text.strip()
 
+def format_reviews(place):
+    """Review count without parentheses, e.g. "(1,234)" -> "1,234"."""
+    if place.review_total is not None:
+        return f"{place.review_total:,}"
+    # Unparsed counts (other locales, "1.2K"...) are written as scraped
+    return (place.review_count or '').replace('(', '').replace(')', '')
+
 def save_clean_csv(places, filename='google_places_clean.csv'):
     """
     Save Google Maps scraped data to a cleaned CSV, sorted by name.
+    Accepts PlaceRecord objects or plain dicts (e.g. loaded from JSON).
     """
     # Define the columns we want
     headers = [
@@ -24,15 +34,17 @@ def save_clean_csv(places, filename='google_places_clean.csv'):
     # Clean and normalize data
     cleaned_places = []
     for place in places:
+        if isinstance(place, dict):
+            place = PlaceRecord.from_dict(place)
         cleaned_place = {
-            'Name': clean_text(place.get('name')),
-            'Address': clean_text(place.get('address')),
-            'Category': clean_text(place.get('category')),
-            'Rating': place.get('rating', ''),
-            'Reviews': place.get('review_count', '').replace('(', '').replace(')', ''),
-            'Phone': clean_text(place.get('phone')),
-            'Website': place.get('website', ''),
-            'Google Maps URL': place.get('url', '')
+            'Name': clean_text(place.name),
+            'Address': clean_text(place.address),
+            'Category': clean_text(place.category),
+            'Rating': place.rating or '',
+            'Reviews': format_reviews(place),
+            'Phone': clean_text(place.phone),
+            'Website': place.website or '',
+            'Google Maps URL': place.url
         }
         cleaned_places.append(cleaned_place)
     
@@ -8,6 +8,9 @@ import csv
 import json
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
+from place_record import PlaceRecord
+from refresh import RefreshRun, load_snapshot, save_snapshot, save_change_log
+
 
 class GoogleMapsScraperPlaywright:
     def __init__(self, headless=False):
@@ -86,6 +89,43 @@ class GoogleMapsScraperPlaywright:
             print("Timeout waiting for place results")
             return []
     
+    async def get_place_cards(self):
+        """Get the cheap signals (url, name, rating, review count) shown on each result card"""
+        try:
+            # Wait for results to load
+            await self.page.wait_for_selector('a[href*="/maps/place/"]', timeout=10000)
+            
+            cards = await self.page.evaluate('''
+                () => {
+                    const getText = (card, selector) => {
+                        const el = card.querySelector(selector);
+                        return el ? el.textContent.trim() : '';
+                    };
+                    
+                    // Start from the place links (same selector as get_place_links) rather
+                    // than the generated card class, and read signals from the parent card
+                    const cards = {};
+                    document.querySelectorAll('a[href*="/maps/place/"]').forEach(link => {
+                        if (!link.href || cards[link.href]) return;
+                        const card = link.parentElement;
+                        cards[link.href] = {
+                            url: link.href,
+                            name: (link.getAttribute('aria-label') || '').trim(),
+                            rating: getText(card, 'span.MW4etd'),
+                            review_count: getText(card, 'span.UY7F9')
+                        };
+                    });
+                    return Object.values(cards);
+                }
+            ''')
+            
+            print(f"Found {len(cards)} unique places")
+            return cards
+        
+        except PlaywrightTimeout:
+            print("Timeout waiting for place results")
+            return []
+    
     async def extract_place_details(self, url):
         """Navigate to a place and extract all available details"""
         try:
@@ -96,7 +136,7 @@ class GoogleMapsScraperPlaywright:
             await asyncio.sleep(3)
             
             # Extract data using JavaScript
-            place_data = await self.page.evaluate('''
+            fields = await self.page.evaluate('''
                 () => {
                     const getText = (selector) => {
                         const el = document.querySelector(selector);
@@ -131,14 +171,14 @@ class GoogleMapsScraperPlaywright:
                 }
             ''')
             
-            place_data['url'] = url
+            place_data = PlaceRecord(url=url, **fields)
             
-            print(f"  ✓ Extracted: {place_data['name']}")
+            print(f"  ✓ Extracted: {place_data.name}")
             return place_data
         
         except Exception as e:
             print(f"  ✗ Error extracting details: {str(e)}")
-            return {'url': url, 'error': str(e)}
+            return PlaceRecord.from_error(url, e)
     
     async def scrape_search_results(self, search_url, max_places=None):
         """
@@ -180,13 +220,80 @@ class GoogleMapsScraperPlaywright:
         print(f"Scraping complete! Extracted {len(self.all_places_data)} places")
         print(f"{'='*60}\n")
     
+    async def refresh_search_results(self, search_url, max_places=None, max_age_days=7,
+                                     snapshot_file='google_places_snapshot.json',
+                                     changes_file='google_places_changes.json',
+                                     detect_removed=False):
+        """
+        Re-run a search, only visiting places that are new, changed or stale
+        
+        Args:
+            search_url: The Google Maps search URL
+            max_places: Maximum number of places to check (None for all)
+            max_age_days: Re-scrape places older than this even if their card is unchanged
+            snapshot_file: Snapshot from the last run (created if missing)
+            changes_file: Change log that this run's field-level changes are appended to
+            detect_removed: Log snapshot places missing from the results as removed. Only
+                useful when the scrolled results cover the whole search (ignored with max_places)
+        """
+        run = RefreshRun(load_snapshot(snapshot_file), max_age_days=max_age_days)
+        
+        await self.init_browser()
+        
+        print(f"Opening search URL: {search_url}\n")
+        await self.page.goto(search_url, wait_until='networkidle', timeout=30000)
+        
+        # Wait for initial results to load
+        await asyncio.sleep(5)
+        
+        # Scroll to load more results
+        await self.scroll_results_panel(scrolls=8)
+        
+        # Read the cheap signals from every result card
+        cards = await self.get_place_cards()
+        
+        if not cards:
+            # Don't touch the snapshot - an empty page would mark every place as removed
+            print("No place cards found, aborting refresh (snapshot left unchanged)")
+            return
+        
+        if max_places:
+            cards = cards[:max_places]
+        
+        print(f"\n{'='*60}")
+        print(f"Checking {len(cards)} places for changes...")
+        print(f"{'='*60}")
+        
+        for i, card in enumerate(cards, 1):
+            print(f"\n[{i}/{len(cards)}]", end=" ")
+            reason = run.reason_for(card)
+            if reason is None:
+                print(f"  - Unchanged: {card['name']}")
+                self.all_places_data.append(run.keep(card))
+                continue
+            
+            print(f"({reason})", end=" ")
+            place_data = await self.extract_place_details(card['url'])
+            self.all_places_data.append(run.update(place_data, card))
+            await asyncio.sleep(2)  # Be respectful with requests
+        
+        run.finish(complete=detect_removed and not max_places)
+        
+        print(f"\n{'='*60}")
+        print(f"Refresh complete! Visited {len(cards) - run.skipped} places "
+              f"({run.failed} failed), skipped {run.skipped} unchanged, {len(run.changes)} changes")
+        print(f"{'='*60}\n")
+        
+        save_snapshot(run.current, snapshot_file)
+        save_change_log(run.changes, run.run_at, changes_file)
+    
     def save_to_csv(self, filename='google_places.csv'):
         """Save scraped data to CSV"""
         if not self.all_places_data:
             print("No data to save!")
             return
         
-        # Get all unique keys
+        # Error records only carry url/error, so collect the union of columns
         all_keys = set()
         for place in self.all_places_data:
             all_keys.update(place.keys())
@@ -196,7 +303,7 @@ class GoogleMapsScraperPlaywright:
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(self.all_places_data)
+            writer.writerows(place.to_dict() for place in self.all_places_data)
         
         print(f"✓ Data saved to {filename}")
     
@@ -207,7 +314,7 @@ class GoogleMapsScraperPlaywright:
             return
         
         with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(self.all_places_data, jsonfile, indent=2, ensure_ascii=False)
+            json.dump([place.to_dict() for place in self.all_places_data], jsonfile, indent=2, ensure_ascii=False)
         
         print(f"✓ Data saved to {filename}")
     
@@ -230,12 +337,17 @@ async def main():
     max_places = input("Max places to scrape (press Enter for all): ").strip()
     max_places = int(max_places) if max_places.isdigit() else None
     
+    refresh = input("Refresh mode - only re-scrape new/changed places? (y/n, default=n): ").strip().lower() == 'y'
+    
     # Initialize scraper
     scraper = GoogleMapsScraperPlaywright(headless=False)
     
     try:
         # Scrape places
-        await scraper.scrape_search_results(search_url, max_places=max_places)
+        if refresh:
+            await scraper.refresh_search_results(search_url, max_places=max_places)
+        else:
+            await scraper.scrape_search_results(search_url, max_places=max_places)
         
         # Save results
         scraper.save_to_csv('google_places.csv')
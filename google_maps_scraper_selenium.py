@@ -15,6 +15,9 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from place_record import PlaceRecord
+from refresh import RefreshRun, load_snapshot, save_snapshot, save_change_log
+
 
 class GoogleMapsScraper:
     def __init__(self, headless=False):
@@ -79,6 +82,35 @@ class GoogleMapsScraper:
             print("Timeout waiting for place results")
             return []
     
+    def get_place_cards(self):
+        """Get the cheap signals (url, name, rating, review count) shown on each result card"""
+        try:
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href*="/maps/place/"]'))
+            )
+        except TimeoutException:
+            print("Timeout waiting for place results")
+            return []
+        
+        # Start from the place links (same selector as get_place_links) rather than the
+        # generated card class, and read the signals from each link's parent card
+        cards = {}
+        for link in self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/maps/place/"]'):
+            url = link.get_attribute('href')
+            if not url or url in cards:
+                continue
+            
+            card = link.find_element(By.XPATH, '..')
+            cards[url] = {
+                'url': url,
+                'name': (link.get_attribute('aria-label') or '').strip(),
+                'rating': self.safe_extract_from(card, 'span.MW4etd'),
+                'review_count': self.safe_extract_from(card, 'span.UY7F9'),
+            }
+        
+        print(f"Found {len(cards)} unique places")
+        return list(cards.values())
+    
     def extract_place_details(self, url):
         """Navigate to a place and extract all available details"""
         try:
@@ -88,33 +120,31 @@ class GoogleMapsScraper:
             # Wait for the page to load
             time.sleep(3)
             
-            place_data = {
-                'url': url,
-                'name': self.safe_extract('h1.DUwDvf'),
-                'rating': self.safe_extract('div.F7nice span[aria-hidden="true"]'),
-                'review_count': self.safe_extract('div.F7nice span[aria-label*="reviews"]'),
-                'category': self.safe_extract('button[jsaction*="category"]'),
-                'address': self.safe_extract('button[data-item-id="address"]'),
-                'website': self.safe_extract_attribute('a[data-item-id="authority"]', 'href'),
-                'phone': self.safe_extract('button[data-item-id*="phone"]'),
-                'plus_code': self.safe_extract('button[data-item-id="oloc"]'),
-                'hours': self.extract_hours(),
-                'price_level': self.safe_extract('span[aria-label*="Price"]'),
-                'description': self.safe_extract('div.PYvSYb'),
-            }
-            
-            # Extract additional attributes (e.g., "Wheelchair accessible", "Outdoor seating")
-            place_data['attributes'] = self.extract_attributes()
-            
-            # Try to get popular times if visible
-            place_data['popular_times'] = self.extract_popular_times()
+            place_data = PlaceRecord(
+                url=url,
+                name=self.safe_extract('h1.DUwDvf'),
+                rating=self.safe_extract('div.F7nice span[aria-hidden="true"]'),
+                review_count=self.safe_extract('div.F7nice span[aria-label*="reviews"]'),
+                category=self.safe_extract('button[jsaction*="category"]'),
+                address=self.safe_extract('button[data-item-id="address"]'),
+                website=self.safe_extract_attribute('a[data-item-id="authority"]', 'href'),
+                phone=self.safe_extract('button[data-item-id*="phone"]'),
+                plus_code=self.safe_extract('button[data-item-id="oloc"]'),
+                hours=self.extract_hours(),
+                price_level=self.safe_extract('span[aria-label*="Price"]'),
+                description=self.safe_extract('div.PYvSYb'),
+                # Additional attributes (e.g., "Wheelchair accessible", "Outdoor seating")
+                attributes=self.extract_attributes(),
+                # Popular times if visible
+                popular_times=self.extract_popular_times(),
+            )
             
-            print(f"  ✓ Extracted: {place_data['name']}")
+            print(f"  ✓ Extracted: {place_data.name}")
             return place_data
         
         except Exception as e:
             print(f"  ✗ Error extracting details: {str(e)}")
-            return {'url': url, 'error': str(e)}
+            return PlaceRecord.from_error(url, e)
     
     def safe_extract(self, selector, multiple=False):
         """Safely extract text from element(s)"""
@@ -128,6 +158,13 @@ class GoogleMapsScraper:
         except NoSuchElementException:
             return "" if not multiple else []
     
+    def safe_extract_from(self, element, selector):
+        """Safely extract text from a child of the given element"""
+        try:
+            return element.find_element(By.CSS_SELECTOR, selector).text.strip()
+        except NoSuchElementException:
+            return ""
+    
     def safe_extract_attribute(self, selector, attribute):
         """Safely extract attribute from element"""
         try:
@@ -207,13 +244,78 @@ class GoogleMapsScraper:
         print(f"Scraping complete! Extracted {len(self.all_places_data)} places")
         print(f"{'='*60}\n")
     
+    def refresh_search_results(self, search_url, max_places=None, max_age_days=7,
+                               snapshot_file='google_places_snapshot.json',
+                               changes_file='google_places_changes.json',
+                               detect_removed=False):
+        """
+        Re-run a search, only visiting places that are new, changed or stale
+        
+        Args:
+            search_url: The Google Maps search URL
+            max_places: Maximum number of places to check (None for all)
+            max_age_days: Re-scrape places older than this even if their card is unchanged
+            snapshot_file: Snapshot from the last run (created if missing)
+            changes_file: Change log that this run's field-level changes are appended to
+            detect_removed: Log snapshot places missing from the results as removed. Only
+                useful when the scrolled results cover the whole search (ignored with max_places)
+        """
+        run = RefreshRun(load_snapshot(snapshot_file), max_age_days=max_age_days)
+        
+        print(f"Opening search URL: {search_url}\n")
+        self.driver.get(search_url)
+        
+        # Wait for initial results to load
+        time.sleep(5)
+        
+        # Scroll to load more results
+        self.scroll_results_panel(scrolls=8)
+        
+        # Read the cheap signals from every result card
+        cards = self.get_place_cards()
+        
+        if not cards:
+            # Don't touch the snapshot - an empty page would mark every place as removed
+            print("No place cards found, aborting refresh (snapshot left unchanged)")
+            return
+        
+        if max_places:
+            cards = cards[:max_places]
+        
+        print(f"\n{'='*60}")
+        print(f"Checking {len(cards)} places for changes...")
+        print(f"{'='*60}")
+        
+        for i, card in enumerate(cards, 1):
+            print(f"\n[{i}/{len(cards)}]", end=" ")
+            reason = run.reason_for(card)
+            if reason is None:
+                print(f"  - Unchanged: {card['name']}")
+                self.all_places_data.append(run.keep(card))
+                continue
+            
+            print(f"({reason})", end=" ")
+            place_data = self.extract_place_details(card['url'])
+            self.all_places_data.append(run.update(place_data, card))
+            time.sleep(2)  # Be respectful with requests
+        
+        run.finish(complete=detect_removed and not max_places)
+        
+        print(f"\n{'='*60}")
+        print(f"Refresh complete! Visited {len(cards) - run.skipped} places "
+              f"({run.failed} failed), skipped {run.skipped} unchanged, {len(run.changes)} changes")
+        print(f"{'='*60}\n")
+        
+        save_snapshot(run.current, snapshot_file)
+        save_change_log(run.changes, run.run_at, changes_file)
+    
     def save_to_csv(self, filename='google_places.csv'):
         """Save scraped data to CSV"""
         if not self.all_places_data:
             print("No data to save!")
             return
         
-        # Get all unique keys from all dictionaries
+        # Error records only carry url/error, so collect the union of columns
         all_keys = set()
         for place in self.all_places_data:
             all_keys.update(place.keys())
@@ -223,7 +325,7 @@ class GoogleMapsScraper:
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(self.all_places_data)
+            writer.writerows(place.to_dict() for place in self.all_places_data)
         
         print(f"✓ Data saved to {filename}")
     
@@ -234,7 +336,7 @@ class GoogleMapsScraper:
             return
         
         with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(self.all_places_data, jsonfile, indent=2, ensure_ascii=False)
+            json.dump([place.to_dict() for place in self.all_places_data], jsonfile, indent=2, ensure_ascii=False)
         
         print(f"✓ Data saved to {filename}")
     
@@ -256,12 +358,17 @@ def main():
     max_places = input("Max places to scrape (press Enter for all): ").strip()
     max_places = int(max_places) if max_places.isdigit() else None
     
+    refresh = input("Refresh mode - only re-scrape new/changed places? (y/n, default=n): ").strip().lower() == 'y'
+    
     # Initialize scraper
     scraper = GoogleMapsScraper(headless=False)  # Set to True to hide browser
     
     try:
         # Scrape places
-        scraper.scrape_search_results(search_url, max_places=max_places)
+        if refresh:
+            scraper.refresh_search_results(search_url, max_places=max_places)
+        else:
+            scraper.scrape_search_results(search_url, max_places=max_places)
         
         # Save results
         scraper.save_to_csv('google_places.csv')
@@ -0,0 +1,97 @@
+"""
+Compact place model shared by the Selenium and Playwright scrapers.
+Uses __slots__ instead of a per-place dict so large scrapes stay small in memory.
+"""
+
+import re
+import sys
+
+# Output field order (the Selenium scraper's original order; Playwright used to write url last)
+FIELDS = (
+    'url', 'name', 'rating', 'review_count', 'category', 'address',
+    'website', 'phone', 'plus_code', 'hours', 'price_level',
+    'description', 'attributes', 'popular_times',
+)
+
+# Fields with few distinct values across a scrape - interned so repeats share one string
+INTERNED_FIELDS = ('rating', 'category', 'price_level')
+
+# Review counts as shown on place pages, e.g. "(1,234)"
+REVIEW_COUNT_PATTERN = re.compile(r'\(?(\d[\d,]*)\)?')
+
+# Google place ID embedded in place URLs, e.g. "!1s0x3397c8f0c2bfd6ed:0x7116bd0bb4eb9852"
+PLACE_ID_PATTERN = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)')
+
+
+class PlaceRecord:
+    __slots__ = FIELDS + ('error', 'place_id', 'rating_value', 'review_total')
+
+    def __init__(self, url='', error=None, **fields):
+        """
+        Build a record, normalizing every field once up front.
+
+        The exported fields keep their scraped text; the rating and review count are
+        also parsed once into rating_value (float) and review_total (int), or None
+        when they're missing or in an unexpected format.
+        """
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown PlaceRecord field(s): {', '.join(sorted(unknown))}")
+
+        self.url = url or ''
+        # An exception with an empty message still marks the record as failed
+        self.error = (str(error) or repr(error)) if error is not None else ''
+        for field in FIELDS[1:]:
+            value = fields.get(field, '')
+            # None (e.g. a missing href) is kept so JSON output still writes null
+            if value is not None:
+                if not isinstance(value, str):
+                    value = str(value)
+                if field in INTERNED_FIELDS:
+                    value = sys.intern(value)
+            setattr(self, field, value)
+        self.place_id = self.extract_place_id(self.url)
+        self.rating_value = self.parse_rating(self.rating)
+        self.review_total = self.parse_review_count(self.review_count)
+
+    @staticmethod
+    def parse_rating(rating):
+        """Parse a rating like "4.5" into a float (None if missing/unparseable)"""
+        try:
+            return float(rating)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def parse_review_count(review_count):
+        """Parse a review count like "(1,234)" into an int (None if missing/unparseable)"""
+        match = REVIEW_COUNT_PATTERN.fullmatch((review_count or '').strip())
+        return int(match.group(1).replace(',', '')) if match else None
+
+    @staticmethod
+    def extract_place_id(url):
+        """Pull the Google place ID out of a place URL (falls back to the URL without its query)"""
+        match = PLACE_ID_PATTERN.search(url or '')
+        # The query string (authuser, rclk...) changes between visits, so it's not part of the ID
+        return match.group(1) if match else (url or '').split('?')[0]
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a record from a scraped/loaded dict"""
+        return cls(**{key: data.get(key) for key in FIELDS + ('error',)})
+
+    @classmethod
+    def from_error(cls, url, error):
+        """Create a record for a place that failed to extract"""
+        return cls(url=url, error=error)
+
+    def keys(self):
+        """Output keys for this record (error records only carry url/error)"""
+        return ('url', 'error') if self.error else FIELDS
+
+    def to_dict(self):
+        """Convert back to the dict layout used for JSON/CSV output"""
+        return {key: getattr(self, key) for key in self.keys()}
+
+    def __repr__(self):
+        return f"PlaceRecord(name={self.name!r}, place_id={self.place_id!r})"
@@ -0,0 +1,220 @@
+"""
+Incremental refresh support shared by the Selenium and Playwright scrapers.
+Keeps a snapshot of the last scrape keyed by place ID so recurring jobs only
+visit detail pages for places that are new, changed, or stale.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from place_record import FIELDS, PlaceRecord
+
+# Result cards only show these, so they're the cheap signals compared before visiting a place
+CARD_SIGNALS = ('name', 'rating', 'review_count')
+
+# Fields that change between visits without the place changing, so they aren't diffed
+# (the URL carries query params like authuser/rclk, popular times shows live busyness)
+VOLATILE_FIELDS = ('url', 'popular_times')
+
+
+def normalize_signal(value):
+    """Normalize a card value so whitespace and '(1,234)' vs '1234' don't count as changes"""
+    return (value or '').replace('(', '').replace(')', '').replace(',', '').strip()
+
+
+class SnapshotEntry:
+    """A stored place: its last record, when it was scraped and the card signals seen with it"""
+    __slots__ = ('record', 'scraped_at', 'card', 'removed')
+
+    def __init__(self, record, scraped_at, card=None, removed=False):
+        self.record = record
+        self.scraped_at = scraped_at
+        self.card = {signal: (card or {}).get(signal, '') for signal in CARD_SIGNALS}
+        self.removed = removed
+
+
+def load_snapshot(filename='google_places_snapshot.json'):
+    """
+    Load the last snapshot.
+
+    Returns:
+        dict of place_id -> SnapshotEntry; empty if no snapshot exists yet
+    """
+    if not os.path.exists(filename):
+        print(f"No snapshot found at {filename}, every place will be scraped")
+        return {}
+
+    with open(filename, encoding='utf-8') as f:
+        entries = json.load(f)
+
+    snapshot = {}
+    for place_id, entry in entries.items():
+        scraped_at = datetime.fromisoformat(entry['scraped_at'])
+        # Hand-edited/older snapshots may lack a timezone; treat them as UTC
+        if scraped_at.tzinfo is None:
+            scraped_at = scraped_at.replace(tzinfo=timezone.utc)
+        snapshot[place_id] = SnapshotEntry(
+            PlaceRecord.from_dict(entry['place']),
+            scraped_at,
+            card=entry.get('card'),
+            removed=entry.get('removed', False),
+        )
+
+    print(f"Loaded snapshot with {len(snapshot)} places from {filename}")
+    return snapshot
+
+
+def save_snapshot(snapshot, filename='google_places_snapshot.json'):
+    """Save a snapshot (place_id -> SnapshotEntry) for the next refresh"""
+    entries = {
+        place_id: {
+            'scraped_at': entry.scraped_at.isoformat(),
+            'card': entry.card,
+            'removed': entry.removed,
+            'place': entry.record.to_dict(),
+        }
+        for place_id, entry in snapshot.items()
+    }
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+
+    print(f"✓ Snapshot saved to {filename}")
+
+
+def refresh_reason(card, previous, max_age):
+    """
+    Decide whether a place's detail page needs to be visited.
+
+    Args:
+        card: dict of cheap signals read from the result card (url, name, rating, review_count)
+        previous: SnapshotEntry from the last snapshot, or None
+        max_age: timedelta after which a place is re-scraped regardless of its signals
+
+    Returns:
+        'new', 'error', 'changed' or 'stale' if the place should be re-scraped, otherwise None
+    """
+    if previous is None:
+        return 'new'
+    if previous.record.error:
+        return 'error'
+    # Compare card to card - detail-page values are formatted differently
+    for signal in CARD_SIGNALS:
+        if normalize_signal(card.get(signal)) != normalize_signal(previous.card.get(signal)):
+            return 'changed'
+    if datetime.now(timezone.utc) - previous.scraped_at > max_age:
+        return 'stale'
+    return None
+
+
+def diff_records(old, new):
+    """Return {field: {'old': ..., 'new': ...}} for every non-volatile field that differs"""
+    return {
+        field: {'old': getattr(old, field), 'new': getattr(new, field)}
+        for field in FIELDS
+        if field not in VOLATILE_FIELDS and getattr(old, field) != getattr(new, field)
+    }
+
+
+def save_change_log(changes, run_at, filename='google_places_changes.json'):
+    """
+    Append one refresh run's field-level changes to the change log.
+
+    The log is a list of {'run_at': ..., 'changes': [...]} entries, oldest first,
+    so earlier runs are kept.
+    """
+    runs = []
+    if os.path.exists(filename):
+        with open(filename, encoding='utf-8') as f:
+            runs = json.load(f)
+
+    runs.append({'run_at': run_at.isoformat(), 'changes': changes})
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(runs, f, indent=2, ensure_ascii=False)
+
+    print(f"✓ Change log saved to {filename} ({len(changes)} changes)")
+
+
+class RefreshRun:
+    """Tracks the snapshot, change log and counters for one refresh run"""
+
+    def __init__(self, snapshot, max_age_days=7):
+        self.previous = snapshot
+        self.current = {}
+        self.changes = []
+        self.max_age = timedelta(days=max_age_days)
+        self.run_at = datetime.now(timezone.utc)
+        self.skipped = 0
+        self.failed = 0
+
+    def log_change(self, place_id, record, change, fields=None):
+        """Add an entry to this run's change log"""
+        self.changes.append({
+            'place_id': place_id, 'name': record.name, 'url': record.url,
+            'change': change, 'fields': fields or {},
+        })
+
+    def reason_for(self, card):
+        """Refresh reason for a result card (see refresh_reason)"""
+        place_id = PlaceRecord.extract_place_id(card['url'])
+        return refresh_reason(card, self.previous.get(place_id), self.max_age)
+
+    def keep(self, card):
+        """Reuse the stored record for an unchanged place"""
+        place_id = PlaceRecord.extract_place_id(card['url'])
+        previous = self.previous[place_id]
+        self.current[place_id] = SnapshotEntry(previous.record, previous.scraped_at, card)
+        if previous.removed:
+            self.log_change(place_id, previous.record, 'readded')
+        self.skipped += 1
+        return previous.record
+
+    def update(self, record, card):
+        """Store a freshly scraped record, log what changed and return the record to keep"""
+        previous = self.previous.get(record.place_id)
+
+        if record.error:
+            self.failed += 1
+            # Don't lose a good stored record to a failed visit; keeping its old card
+            # signals means the place is retried next run if they still differ
+            if previous is not None and not previous.record.error:
+                self.current[record.place_id] = SnapshotEntry(
+                    previous.record, previous.scraped_at, previous.card
+                )
+                if previous.removed:
+                    self.log_change(record.place_id, previous.record, 'readded')
+                return previous.record
+            self.current[record.place_id] = SnapshotEntry(record, self.run_at, card)
+            return record
+
+        self.current[record.place_id] = SnapshotEntry(record, self.run_at, card)
+        if previous is None or previous.record.error:
+            self.log_change(record.place_id, record, 'new')
+        elif previous.removed:
+            self.log_change(record.place_id, record, 'readded', diff_records(previous.record, record))
+        else:
+            fields = diff_records(previous.record, record)
+            if fields:
+                self.log_change(record.place_id, record, 'changed', fields)
+        return record
+
+    def finish(self, complete=True):
+        """
+        Carry over places from the snapshot that weren't seen in this run.
+
+        Args:
+            complete: True if the cards checked are known to be every search result.
+                Unseen places are then logged as removed (once) and flagged in the
+                snapshot; they're never dropped, so a place that drops out of the
+                loaded results doesn't force a re-scrape when it comes back.
+        """
+        for place_id, entry in self.previous.items():
+            if place_id in self.current:
+                continue
+            removed = entry.removed
+            if complete and not removed:
+                self.log_change(place_id, entry.record, 'removed')
+                removed = True
+            self.current[place_id] = SnapshotEntry(entry.record, entry.scraped_at, entry.card, removed)